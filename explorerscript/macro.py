@@ -128,7 +128,7 @@ class ExplorerScriptMacro:
                     new_labels[blueprint_op.label.id].markers = blueprint_op.label.markers.copy()
                 new_root = self._build_op(op_idx_counter, blueprint_op.root, smb, parameters)
                 new_jumps = SsbLabelJump(new_root, new_labels[blueprint_op.label.id])
-                new_jumps.markers = blueprint_op.markers.copy()
+                new_jumps.marker = blueprint_op.marker
                 out_ops.append(new_jumps)
             elif blueprint_op.op_code.name == OP_RETURN:
                 # Process return: Exit the macro instead
@@ -33,7 +33,7 @@ from explorerscript.ssb_converting.compiler.compile_handlers.blocks.ifs.header.o
 from explorerscript.ssb_converting.compiler.compile_handlers.blocks.ifs.header.scn import IfHeaderScnCompileHandler
 from explorerscript.ssb_converting.compiler.compile_handlers.operations.operation import OperationCompileHandler
 from explorerscript.ssb_converting.compiler.utils import CompilerCtx, SsbLabelJumpBlueprint
-from explorerscript.ssb_converting.ssb_special_ops import OP_BRANCH_PERFORMANCE, OPS_BRANCH
+from explorerscript.ssb_converting.ssb_special_ops import OP_BRANCH_PERFORMANCE, OPS_BRANCH_NAMES
 from explorerscript.util import _, f
 
 
@@ -59,7 +59,7 @@ class IfHeaderCompileHandler(AbstractCompileHandler):
                 if len(op) != 1:
                     raise SsbCompilerError(_("Invalid content for an if-header"))
                 op = op[0]
-                if op.op_code.name not in OPS_BRANCH.keys():
+                if op.op_code.name not in OPS_BRANCH_NAMES:
                     raise SsbCompilerError(
                         f(_("Invalid operation for if condition: {op.op_code.name} (line {self.ctx.start.line})"))
                     )
@@ -29,7 +29,7 @@ from igraph import IN
 from explorerscript.ssb_converting.decompiler.graph_building.graph_utils import *
 from explorerscript.ssb_converting.ssb_data_types import SsbOperation
 from explorerscript.ssb_converting.ssb_special_ops import SsbLabelJump, OPS_THAT_END_CONTROL_FLOW, SsbLabel, OP_HOLD, \
-    OP_JUMP, OPS_BRANCH, IfStart, IfEnd, MultiIfStart, OPS_SWITCH_CASE_MAP, SwitchStart, OPS_CTX, SwitchEnd, \
+    OP_JUMP, OPS_BRANCH_NAMES, IfStart, IfEnd, MultiIfStart, OPS_SWITCH_CASE_MAP, SwitchStart, OPS_CTX, SwitchEnd, \
     SwitchCaseOperation, SwitchFalltrough, ForeverContinue, ForeverBreak, ForeverStart, ForeverEnd, \
     SsbForeignLabel, CallJump
 
@@ -121,7 +121,7 @@ class SsbGraphMinimizer:
             vs_to_delete = set()
             current_if_id = -1
             for v in g.vs:
-                if isinstance(v['op'], SsbLabelJump) and v['op'].root.op_code.name in OPS_BRANCH.keys():
+                if isinstance(v['op'], SsbLabelJump) and v['op'].root.op_code.name in OPS_BRANCH_NAMES:
                     current_if_id += 1
                     # IS A BRANCH OPCODE
                     try:
@@ -276,7 +276,7 @@ class SsbGraphMinimizer:
             vs_to_delete = set()
             current_switch_id = -1
             for v in g.vs:
-                if v['op'].op_code.name in OPS_SWITCH_CASE_MAP.keys() and v not in vs_to_delete:
+                if v['op'].op_code.name in OPS_SWITCH_CASE_MAP and v not in vs_to_delete:
                     current_switch_id += 1
                     # SWITCH
                     out_edges = v.out_edges()
@@ -25,10 +25,10 @@ and inserts labels at the appropriate locations.
 #  SOFTWARE.
 #
 import logging
-from typing import List, Dict
+from typing import List
 
 from explorerscript.ssb_converting.ssb_data_types import SsbOperation
-from explorerscript.ssb_converting.ssb_special_ops import process_op_for_jump, SsbLabel
+from explorerscript.ssb_converting.ssb_special_ops import process_op_for_jump, SsbLabelRegistry
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +36,7 @@ class OpsLabelJumpToResolver:
     def __init__(self, routines: List[List[SsbOperation]]):
         logger.debug("Constructing labels and jumps...")
         # A mapping of labels: {mem_location: label_name}
-        self.labels: Dict[int, SsbLabel] = {}
+        self.labels: SsbLabelRegistry = SsbLabelRegistry()
         self.routines = []
         for routine_id, rtn in enumerate(routines):
             new_rtn_ops = []
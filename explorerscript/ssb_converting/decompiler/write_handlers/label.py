@@ -26,8 +26,8 @@ from igraph import Vertex
 
 from explorerscript.ssb_converting.decompiler.write_handlers.abstract import AbstractWriteHandler
 from explorerscript.ssb_converting.decompiler.write_handlers.labels.forever_start import ForeverWriteHandler
-from explorerscript.ssb_converting.ssb_special_ops import SwitchFalltrough, SsbLabel, IfEnd, SwitchEnd, ForeverStart, \
-    ForeverEnd
+from explorerscript.ssb_converting.ssb_special_ops import SsbLabel, KIND_IF_END, KIND_SWITCH_END, \
+    KIND_SWITCH_FALLTROUGH, KIND_FOREVER_START, KIND_FOREVER_END
 logger = logging.getLogger(__name__)
 
 
@@ -54,15 +54,16 @@ class LabelWriteHandler(AbstractWriteHandler):
 
         # Let's set the attributes of this handler based on the markers.
         for m in op.markers:
-            if isinstance(m, IfEnd):
+            kind = m.KIND
+            if kind == KIND_IF_END:
                 self.ended_ifs.append(m.if_id)
-            elif isinstance(m, SwitchEnd):
+            elif kind == KIND_SWITCH_END:
                 self.ended_switches.append(m.switch_id)
-            elif isinstance(m, SwitchFalltrough):
+            elif kind == KIND_SWITCH_FALLTROUGH:
                 self.switch_fell_through = True
-            elif isinstance(m, ForeverStart):
+            elif kind == KIND_FOREVER_START:
                 self.started_loops.append(m.loop_id)
-            elif isinstance(m, ForeverEnd):
+            elif kind == KIND_FOREVER_END:
                 self.ended_loops.append(m.loop_id)
 
     def write_content(self):
@@ -214,6 +214,7 @@ class SsbOperation:
     def __init__(self, offset: int, op_code: SsbOpCode, params: List[SsbOpParam]):
         self.offset = offset
         self.op_code = op_code
+        # Must be a list (positional params). Dicts of named params are not supported.
         self.params = params
 
     def __repr__(self):
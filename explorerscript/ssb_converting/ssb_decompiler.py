@@ -78,7 +78,7 @@ class ExplorerScriptSsbDecompiler:
         resolver = OpsLabelJumpToResolver(self._routine_ops)
         self._routine_ops = list(resolver)
         has_any_calls = any(any(isinstance(op, SsbLabelJump)
-                                and any(isinstance(x, CallJump) for x in op.markers) for op in rtn)
+                                and isinstance(op.get_marker(), CallJump) for op in rtn)
                             for rtn in self._routine_ops)
 
         # Step 2: Build and optimize execution graph
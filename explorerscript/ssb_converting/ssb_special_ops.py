@@ -25,7 +25,7 @@ TODO: These are only valid for Sky-style ssb.
 #  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #  SOFTWARE.
 #
-from typing import Dict, Union, List, Optional
+from typing import Dict, Union, List, Optional, Iterator, Tuple, Sequence
 
 from igraph import Graph, Vertex
 
@@ -65,6 +65,8 @@ OPS_BRANCH = {
     OP_BRANCH_VARIABLE: 3,
     OP_BRANCH_VARIATION: 1,
 }
+# Names of the branch ops, for membership tests
+OPS_BRANCH_NAMES = frozenset(OPS_BRANCH)
 
 OP_CASE = 'Case'
 OP_CASE_MENU = 'CaseMenu'
@@ -120,6 +122,8 @@ OPS_WITH_JUMP_TO_MEM_OFFSET = {
     OP_CALL: 0,
 }
 OPS_WITH_JUMP_TO_MEM_OFFSET.update(OPS_BRANCH)
+# Pre-bound lookup in OPS_WITH_JUMP_TO_MEM_OFFSET: _jump_idx(name, default)
+_jump_idx = OPS_WITH_JUMP_TO_MEM_OFFSET.get
 
 OPS_ALL_SPECIAL = [
     OP_JUMP, OP_CALL,
@@ -184,20 +188,44 @@ OPS_FLAG_ALL = [
 ]
 
 
+# Type tags of the markers, see the KIND attribute of the marker classes.
+KIND_IF_END = 1
+KIND_SWITCH_END = 2
+KIND_SWITCH_FALLTROUGH = 3
+KIND_FOREVER_START = 4
+KIND_FOREVER_END = 5
+KIND_CALL_JUMP = 6
+KIND_IF_START = 7
+KIND_MULTI_IF_START = 8
+KIND_SWITCH_START = 9
+KIND_FOREVER_CONTINUE = 10
+KIND_FOREVER_BREAK = 11
+
+
 class LabelMarker:
-    pass
+    __slots__ = ()
+    # Type tag of the marker (KIND_*), for cheap dispatch without isinstance.
+    KIND = 0
 
 
 class LabelJumpMarker:
-    pass
+    __slots__ = ()
+    # Type tag of the marker (KIND_*), for cheap dispatch without isinstance.
+    KIND = 0
 
 
 class CallJump(LabelJumpMarker):
+    __slots__ = ()
+    KIND = KIND_CALL_JUMP
+
     def __str__(self):
         return f"CALL"
 
 
 class IfStart(LabelJumpMarker):
+    __slots__ = ('if_id', 'is_not')
+    KIND = KIND_IF_START
+
     def __init__(self, if_id: int):
         self.if_id = if_id
         self.is_not = False
@@ -207,6 +235,9 @@ class IfStart(LabelJumpMarker):
 
 
 class MultiIfStart(IfStart):
+    __slots__ = ('original_ssb_ifs_ops',)
+    KIND = KIND_MULTI_IF_START
+
     def __init__(self, if_id: int, start_ifs):
         super().__init__(if_id)
         self.original_ssb_ifs_ops: List[SsbOperation] = start_ifs
@@ -220,6 +251,9 @@ class MultiIfStart(IfStart):
 
 
 class SwitchStart(LabelJumpMarker):
+    __slots__ = ('switch_id',)
+    KIND = KIND_SWITCH_START
+
     def __init__(self, switch_id: int):
         self.switch_id = switch_id
 
@@ -228,6 +262,9 @@ class SwitchStart(LabelJumpMarker):
 
 
 class ForeverContinue(LabelJumpMarker):
+    __slots__ = ('loop_id',)
+    KIND = KIND_FOREVER_CONTINUE
+
     def __init__(self, loop_id: int):
         self.loop_id = loop_id
 
@@ -236,6 +273,9 @@ class ForeverContinue(LabelJumpMarker):
 
 
 class ForeverBreak(LabelJumpMarker):
+    __slots__ = ('loop_id',)
+    KIND = KIND_FOREVER_BREAK
+
     def __init__(self, loop_id: int):
         self.loop_id = loop_id
 
@@ -244,6 +284,9 @@ class ForeverBreak(LabelJumpMarker):
 
 
 class IfEnd(LabelMarker):
+    __slots__ = ('if_id',)
+    KIND = KIND_IF_END
+
     def __init__(self, if_id: int):
         self.if_id = if_id
 
@@ -252,6 +295,9 @@ class IfEnd(LabelMarker):
 
 
 class SwitchEnd(LabelMarker):
+    __slots__ = ('switch_id',)
+    KIND = KIND_SWITCH_END
+
     def __init__(self, switch_id: int):
         self.switch_id = switch_id
 
@@ -260,11 +306,17 @@ class SwitchEnd(LabelMarker):
 
 
 class SwitchFalltrough(LabelMarker):
+    __slots__ = ()
+    KIND = KIND_SWITCH_FALLTROUGH
+
     def __str__(self):
         return f"FALL"
 
 
 class ForeverStart(LabelMarker):
+    __slots__ = ('loop_id',)
+    KIND = KIND_FOREVER_START
+
     def __init__(self, loop_id: int):
         self.loop_id = loop_id
 
@@ -273,6 +325,9 @@ class ForeverStart(LabelMarker):
 
 
 class ForeverEnd(LabelMarker):
+    __slots__ = ('loop_id',)
+    KIND = KIND_FOREVER_END
+
     def __init__(self, loop_id: int):
         self.loop_id = loop_id
 
@@ -301,18 +356,19 @@ class SsbLabel(SsbOperation):
     def needs_to_be_printed(self, my_vertex_index: int, number_in_vs: int, graph: Graph):
         """If the number of incoming vertices is bigger than max_in_vs, then we need to print this label"""
         # TODO: There are still issues with this logic, we just output all for now (except switch fallthroughs!)
-        return not(any([isinstance(m, SwitchFalltrough) for m in self.markers]))
+        return not(any([m.KIND == KIND_SWITCH_FALLTROUGH for m in self.markers]))
         if self.force_write or my_vertex_index == 0 or self.referenced_from_other_routine:
             # If the label is the root vertex or referenced from another routine we NEED to output it!
             return True
         max_in_vs = 1
         for m in self.markers:
-            if isinstance(m, SwitchFalltrough):
+            kind = m.KIND
+            if kind == KIND_SWITCH_FALLTROUGH:
                 # Switch fallthroughs can not be printed.
                 return False
-            if isinstance(m, IfEnd):
+            if kind == KIND_IF_END:
                 max_in_vs += 1  # Each if adds one else branch.
-            if isinstance(m, SwitchEnd):
+            elif kind == KIND_SWITCH_END:
                 start: Vertex = self._find_switch_start_vertex(graph, m.switch_id)
                 if not start:
                     raise ValueError(f"Start for switch {m.switch_id} not found.")
@@ -325,9 +381,9 @@ class SsbLabel(SsbOperation):
             if 'op' not in v.attributes():
                 continue
             if isinstance(v['op'], SsbLabelJump):
-                for m in v['op'].markers:
-                    if isinstance(m, SwitchStart) and m.switch_id == switch_id:
-                        return v
+                m = v['op'].marker
+                if m is not None and m.KIND == KIND_SWITCH_START and m.switch_id == switch_id:
+                    return v
         return None
 
     def __str__(self):
@@ -357,28 +413,43 @@ class SsbLabelJump(SsbOperation):
         self.root = root
         # May be None, if so the connected edges determine the different jumps
         self.label = label
-        # Markers for this jump (type of jump)
-        self.markers: List[LabelJumpMarker] = []
+        # Marker for this jump (type of jump), jumps can only have one or zero markers.
+        self.marker: Optional[LabelJumpMarker] = None
+
+    @property
+    def markers(self) -> Tuple[LabelJumpMarker, ...]:
+        """
+        The marker as a tuple with one or zero entries. Prefer get_marker.
+        This is a read-only view, use add_marker / remove_marker (or assign markers) to change it.
+        """
+        if self.marker is None:
+            return ()
+        return (self.marker,)
+
+    @markers.setter
+    def markers(self, value: Sequence[LabelJumpMarker]):
+        if len(value) > 1:
+            raise ValueError("Jumps can currently only have one or zero markers.")
+        self.marker = value[0] if len(value) > 0 else None
 
     def add_marker(self, m: LabelJumpMarker):
-        if len(self.markers) > 0:
+        if self.marker is not None:
             raise ValueError("Jumps can currently only have one or zero markers.")
-        self.markers.append(m)
+        self.marker = m
 
     def remove_marker(self):
         """Remove the first (and only) marker if exists."""
-        if len(self.markers) > 0:
-            del self.markers[0]
+        self.marker = None
 
     def get_marker(self):
         """Returns the first (and only) marker if exists, otherwise None."""
-        if len(self.markers) > 0:
-            return self.markers[0]
-        return None
+        return self.marker
 
 
 class SwitchCaseOperation:
     """ For marking the edge of a switch. """
+    __slots__ = ('switch_index', 'index', 'op')
+
     def __init__(self, switch_index: int, index: int, op: SsbOperation):
         self.switch_index = switch_index
         self.index = index
@@ -388,7 +459,45 @@ class SwitchCaseOperation:
         return f"{self.switch_index}:{self.index} :: {self.op}"
 
 
-def process_op_for_jump(op: SsbOperation, known_labels: Dict[int, SsbLabel], routine_id: int) -> SsbOperation:
+class SsbLabelRegistry:
+    """
+    Mapping of memory offsets to the labels that were generated for them: {mem_location: label}.
+    Also keeps track of the next free label id, so that new labels can be created without scanning
+    all known labels.
+    """
+    def __init__(self):
+        self.mapping: Dict[int, SsbLabel] = {}
+        self.next_id = 0
+
+    def __contains__(self, offset: int) -> bool:
+        return offset in self.mapping
+
+    def __getitem__(self, offset: int) -> SsbLabel:
+        return self.mapping[offset]
+
+    def __setitem__(self, offset: int, label: SsbLabel):
+        self.mapping[offset] = label
+        if label.id >= self.next_id:
+            self.next_id = label.id + 1
+
+    def __len__(self):
+        return len(self.mapping)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.mapping)
+
+    def values(self):
+        return self.mapping.values()
+
+    def items(self):
+        return self.mapping.items()
+
+
+# Sentinel for lookups that had no result
+_MISSING = object()
+
+
+def process_op_for_jump(op: SsbOperation, known_labels: SsbLabelRegistry, routine_id: int) -> SsbOperation:
     """
     Processes the operation.
     If it doesn't contain a jump to a memory offset, op is simply returned.
@@ -399,30 +508,27 @@ def process_op_for_jump(op: SsbOperation, known_labels: Dict[int, SsbLabel], rou
     - If not found: A new label with an auto-incremented id is generated and added to the known_labels.
                     Then: see above for "if found".
     """
-    if op.op_code.name in OPS_WITH_JUMP_TO_MEM_OFFSET.keys():
-        param_list = op.params if isinstance(op.params, list) else list(op.params.values())
-        jump_param_idx = OPS_WITH_JUMP_TO_MEM_OFFSET[op.op_code.name]
-        if len(param_list) < jump_param_idx:
-            raise ValueError(f"The parameters for the OpCode {op.op_code.name} must contain a jump address at index {jump_param_idx}.")
-        old_offset = param_list[jump_param_idx]
-        if old_offset in known_labels:
-            label = known_labels[old_offset]
-            if routine_id != label.routine_id:
-                label.referenced_from_other_routine = True
-        else:
-            if len(known_labels) == 0:
-                next_label_id = 0
-            else:
-                next_label_id = max(label.id for label in known_labels.values()) + 1
-            label = SsbLabel(next_label_id, routine_id)
-            known_labels[old_offset] = label
-        new_params = param_list.copy()
-        del new_params[jump_param_idx]
-        jmp = SsbLabelJump(
-            SsbOperation(op.offset, op.op_code, new_params),
-            label
-        )
-        if op.op_code.name == OP_CALL:
-            jmp.markers.append(CallJump())
-        return jmp
-    return op
+    name = op.op_code.name
+    jump_param_idx = _jump_idx(name, _MISSING)
+    if jump_param_idx is _MISSING:
+        return op
+    param_list = op.params
+    if len(param_list) < jump_param_idx:
+        raise ValueError(f"The parameters for the OpCode {name} must contain a jump address at index {jump_param_idx}.")
+    old_offset = param_list[jump_param_idx]
+    if old_offset in known_labels:
+        label = known_labels[old_offset]
+        if routine_id != label.routine_id:
+            label.referenced_from_other_routine = True
+    else:
+        label = SsbLabel(known_labels.next_id, routine_id)
+        known_labels[old_offset] = label
+    new_params = param_list.copy()
+    del new_params[jump_param_idx]
+    jmp = SsbLabelJump(
+        SsbOperation(op.offset, op.op_code, new_params),
+        label
+    )
+    if name == OP_CALL:
+        jmp.marker = CallJump()
+    return jmp
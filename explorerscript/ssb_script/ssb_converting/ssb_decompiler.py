@@ -95,8 +95,6 @@ class SsbScriptSsbDecompiler:
             real_op = op.root
 
         orig_params = real_op.params
-        if isinstance(op.params, dict):
-            orig_params = real_op.params.values()
 
         # Build parameter string
         params = ", ".join(
@@ -1,17 +1,54 @@
 __version__ = '0.1.1'
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # README read-in
+import warnings
 from os import path
 this_directory = path.abspath(path.dirname(__file__))
-with open(path.join(this_directory, 'README.rst'), encoding='utf-8') as f:
-    long_description = f.read()
+try:
+    with open(path.join(this_directory, 'README.rst'), encoding='utf-8') as f:
+        long_description = f.read()
+except FileNotFoundError:
+    warnings.warn("README.rst not found, the package will have no long description.")
+    long_description = ''
 # END README read-in
 
 setup(
     name='explorerscript',
     version=__version__,
-    packages=find_packages(),
+    # Keep in sync with the package directories (setuptools.find_packages() excluding tests).
+    packages=[
+        'explorerscript',
+        'explorerscript.antlr',
+        'explorerscript.cli',
+        'explorerscript.pygments',
+        'explorerscript.ssb_converting',
+        'explorerscript.ssb_converting.compiler',
+        'explorerscript.ssb_converting.compiler.compile_handlers',
+        'explorerscript.ssb_converting.compiler.compile_handlers.assignments',
+        'explorerscript.ssb_converting.compiler.compile_handlers.atoms',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks.ctxs',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks.ifs',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks.ifs.header',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks.loop',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks.switches',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks.switches.case_headers',
+        'explorerscript.ssb_converting.compiler.compile_handlers.blocks.switches.switch_headers',
+        'explorerscript.ssb_converting.compiler.compile_handlers.functions',
+        'explorerscript.ssb_converting.compiler.compile_handlers.operations',
+        'explorerscript.ssb_converting.compiler.compile_handlers.statements',
+        'explorerscript.ssb_converting.compiler.compiler_visitor',
+        'explorerscript.ssb_converting.decompiler',
+        'explorerscript.ssb_converting.decompiler.graph_building',
+        'explorerscript.ssb_converting.decompiler.write_handlers',
+        'explorerscript.ssb_converting.decompiler.write_handlers.label_jumps',
+        'explorerscript.ssb_converting.decompiler.write_handlers.labels',
+        'explorerscript.ssb_converting.decompiler.write_handlers.simple_ops',
+        'explorerscript.ssb_script',
+        'explorerscript.ssb_script.ssb_converting',
+        'explorerscript.ssb_script.ssb_converting.compiler',
+    ],
     description='ExplorerScript and SSBScript: Script languages for decompiled SSB (Pokémon Mystery Dungeon Explorers of Sky)',
     long_description=long_description,
     long_description_content_type='text/x-rst',